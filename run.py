@@ -17,6 +17,7 @@ Available tools:
 - author_batch_details
 - get_paper_recommendations_single
 - get_paper_recommendations_multi
+- get_paper_recommendations_batch
 """
 
 # Import the mcp instance from centralized location
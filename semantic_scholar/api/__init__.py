@@ -23,5 +23,6 @@ from .authors import (
 
 from .recommendations import (
     get_paper_recommendations_single,
-    get_paper_recommendations_multi
+    get_paper_recommendations_multi,
+    get_paper_recommendations_batch
 ) 
\ No newline at end of file
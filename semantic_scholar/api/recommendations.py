@@ -2,15 +2,45 @@
 Recommendation-related API endpoints for the Semantic Scholar API.
 """
 
+import asyncio
+import logging
 from typing import Dict, List, Optional
+from urllib.parse import quote
 from fastmcp import Context
 import httpx
+import orjson
 
 # Import mcp from centralized location instead of server
 from ..mcp import mcp
 from ..config import Config, ErrorType
-from ..utils.http import rate_limiter, get_api_key
+from ..utils.http import rate_limiter, get_api_key, get_client, parse_retry_after
 from ..utils.errors import create_error_response
+from ..utils.cache import async_ttl_cache, single_flight
+
+logger = logging.getLogger(__name__)
+
+# Request constants, resolved once at import time
+_API_KEY = get_api_key()
+_HEADERS = {"x-api-key": _API_KEY} if _API_KEY else {}
+_JSON_HEADERS = {"content-type": "application/json", **_HEADERS}
+_SINGLE_URL_PREFIX = f"{Config.RECOMMENDATIONS_BASE_URL}/papers/forpaper/"
+_MULTI_URL = f"{Config.RECOMMENDATIONS_BASE_URL}/papers"
+
+# Static validation errors, built once and returned as-is
+_VALID_POOLS = ("recent", "all-cs")
+_ERR_EMPTY_PAPER_ID = create_error_response(
+    ErrorType.VALIDATION,
+    "Paper ID cannot be empty"
+)
+_ERR_INVALID_POOL = create_error_response(
+    ErrorType.VALIDATION,
+    "Invalid paper pool specified",
+    {"valid_pools": list(_VALID_POOLS)}
+)
+_ERR_NO_POSITIVE_IDS = create_error_response(
+    ErrorType.VALIDATION,
+    "Must provide at least one positive paper ID"
+)
 
 @mcp.tool()
 async def get_paper_recommendations_single(
@@ -35,6 +65,8 @@ async def get_paper_recommendations_single(
             - PMID:<id> (e.g., "PMID:19872477")
             - PMCID:<id> (e.g., "PMCID:2323736")
             - URL:<url> (e.g., "URL:https://arxiv.org/abs/2106.15928v1")
+            The ID is percent-encoded before being placed in the request path,
+            so IDs containing ":" or "/" can be passed as-is.
 
         fields (Optional[str]): Comma-separated list of fields to return for each paper.
             paperId is always returned.
@@ -54,10 +86,150 @@ async def get_paper_recommendations_single(
             "recommendedPapers": List[Dict] # List of recommended papers with requested fields
         }
     """
+    return await _fetch_single_recommendations(paper_id, fields, limit, from_pool)
+
+@mcp.tool()
+async def get_paper_recommendations_batch(
+    context: Context,
+    paper_ids: List[str],
+    fields: Optional[str] = None,
+    limit: int = 100,
+    from_pool: str = "recent"
+) -> Dict:
+    """
+    Get single-paper recommendations for several seed papers in one call.
+    Each seed is looked up independently, as with get_paper_recommendations_single.
+    Lookups are rate limited to about one per second, so a batch of N new seeds
+    takes roughly N seconds; seeds looked up recently are answered from cache.
+
+    Args:
+        paper_ids (List[str]): List of seed paper identifiers.
+            Each ID can be in any of the formats accepted by get_paper_recommendations_single.
+            Maximum: 10 IDs per request
+
+        fields (Optional[str]): Comma-separated list of fields to return for each paper.
+            paperId is always returned.
+
+        limit (int): Maximum number of recommendations to return per seed paper.
+            Default: 100
+            Maximum: 500
+
+        from_pool (str): Which pool of papers to recommend from.
+            Options:
+            - "recent": Recent papers (default)
+            - "all-cs": All computer science papers
+            Default: "recent"
+
+    Returns:
+        Dict: {
+            "<paper_id>": Dict # Recommendations or error response for each seed paper
+        }
+    """
+    if not paper_ids:
+        return create_error_response(
+            ErrorType.VALIDATION,
+            "Paper IDs list cannot be empty"
+        )
+
+    if len(paper_ids) > Config.MAX_RECOMMENDATION_BATCH_SIZE:
+        return create_error_response(
+            ErrorType.VALIDATION,
+            f"Cannot process more than {Config.MAX_RECOMMENDATION_BATCH_SIZE} paper IDs at once",
+            {"max_papers": Config.MAX_RECOMMENDATION_BATCH_SIZE, "received": len(paper_ids)}
+        )
+
+    # Shared arguments are validated once rather than failing for every paper
+    if limit > 500:
+        return create_error_response(
+            ErrorType.VALIDATION,
+            "Cannot request more than 500 recommendations",
+            {"max_limit": 500, "requested": limit}
+        )
+
+    if from_pool not in _VALID_POOLS:
+        return _ERR_INVALID_POOL
+
+    semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+
+    async def fetch_one(paper_id: str) -> Dict:
+        async with semaphore:
+            return await _fetch_single_recommendations(paper_id, fields, limit, from_pool)
+
+    results = await asyncio.gather(
+        *[fetch_one(paper_id) for paper_id in paper_ids],
+        return_exceptions=True
+    )
+
+    batch = {}
+    for paper_id, result in zip(paper_ids, results):
+        if isinstance(result, BaseException):
+            result = create_error_response(
+                ErrorType.API_ERROR,
+                "Failed to get recommendations",
+                {"error": str(result)}
+            )
+        batch[paper_id] = result
+    return batch
+
+def _single_key(
+    paper_id: str,
+    fields: Optional[str],
+    limit: int,
+    from_pool: str
+) -> tuple:
+    """Build the cache and in-flight key for a single-paper request."""
+    return paper_id, fields, limit, from_pool
+
+def _multi_key(
+    positive_paper_ids: List[str],
+    negative_paper_ids: Optional[List[str]],
+    fields: Optional[str],
+    limit: int
+) -> tuple:
+    """
+    Build the cache and in-flight key for a multi-paper request.
+
+    IDs are normalised the same way as the request body (duplicates and
+    negatives that are also positive dropped), so equivalent requests share a key.
+    """
+    positive_set = set(positive_paper_ids)
+    negative_set = set(negative_paper_ids or ()) - positive_set
+    return (
+        tuple(sorted(positive_set)),
+        tuple(sorted(negative_set)),
+        fields,
+        limit
+    )
+
+async def _read_json(response: httpx.Response) -> Dict:
+    """
+    Read a streamed response body into a single buffer and decode it as JSON.
+
+    Non-2xx responses are read in full before raising, so their text is still
+    available to the HTTPStatusError handlers.
+    """
+    if not response.is_success:
+        await response.aread()
+        response.raise_for_status()
+
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body.extend(chunk)
+    return orjson.loads(body)
+
+@async_ttl_cache(maxsize=Config.CACHE_MAX_SIZE, ttl=Config.CACHE_TTL, key=_single_key)
+@single_flight(key=_single_key)
+async def _fetch_single_recommendations(
+    paper_id: str,
+    fields: Optional[str],
+    limit: int,
+    from_pool: str
+) -> Dict:
+    """Fetch recommendations for a single seed paper."""
     try:
-        # Apply rate limiting
-        endpoint = "/recommendations"
-        await rate_limiter.acquire(endpoint)
+        # Validate before rate limiting so rejected requests don't use up tokens
+        if not paper_id:
+            return _ERR_EMPTY_PAPER_ID
 
         # Validate limit
         if limit > 500:
@@ -68,12 +240,12 @@ async def get_paper_recommendations_single(
             )
 
         # Validate pool
-        if from_pool not in ["recent", "all-cs"]:
-            return create_error_response(
-                ErrorType.VALIDATION,
-                "Invalid paper pool specified",
-                {"valid_pools": ["recent", "all-cs"]}
-            )
+        if from_pool not in _VALID_POOLS:
+            return _ERR_INVALID_POOL
+
+        # Apply rate limiting
+        endpoint = "/recommendations"
+        await rate_limiter.acquire(endpoint)
 
         # Build request parameters
         params = {
@@ -84,13 +256,9 @@ async def get_paper_recommendations_single(
             params["fields"] = fields
 
         # Make the API request
-        async with httpx.AsyncClient(timeout=Config.TIMEOUT) as client:
-            api_key = get_api_key()
-            headers = {"x-api-key": api_key} if api_key else {}
-            
-            url = f"https://api.semanticscholar.org/recommendations/v1/papers/forpaper/{paper_id}"
-            response = await client.get(url, params=params, headers=headers)
-            
+        client = get_client()
+        url = _SINGLE_URL_PREFIX + quote(paper_id, safe="")
+        async with client.stream("GET", url, params=params, headers=_HEADERS) as response:
             # Handle specific error cases
             if response.status_code == 404:
                 return create_error_response(
@@ -98,18 +266,21 @@ async def get_paper_recommendations_single(
                     "Paper not found",
                     {"paper_id": paper_id}
                 )
-            
-            response.raise_for_status()
-            return response.json()
+
+            result = await _read_json(response)
+
+        rate_limiter.on_success(endpoint)
+        return result
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 429:
+            rate_limiter.on_429(endpoint, parse_retry_after(e.response.headers.get("retry-after")))
             return create_error_response(
                 ErrorType.RATE_LIMIT,
                 "Rate limit exceeded. Consider using an API key for higher limits.",
                 {
                     "retry_after": e.response.headers.get("retry-after"),
-                    "authenticated": bool(get_api_key())
+                    "authenticated": bool(_API_KEY)
                 }
             )
         return create_error_response(
@@ -123,8 +294,6 @@ async def get_paper_recommendations_single(
             f"Request timed out after {Config.TIMEOUT} seconds"
         )
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Unexpected error in recommendations: {str(e)}")
         return create_error_response(
             ErrorType.API_ERROR,
@@ -148,6 +317,7 @@ async def get_paper_recommendations_multi(
     Args:
         positive_paper_ids (List[str]): List of paper IDs to use as positive examples.
             Papers similar to these will be recommended.
+            Duplicate IDs are ignored. Maximum: 100 unique IDs
             Each ID can be in any of these formats:
             - Semantic Scholar ID (e.g., "649def34f8be52c8b66281af98ae884c09aef38b")
             - CorpusId:<id> (e.g., "CorpusId:215416146")
@@ -162,6 +332,7 @@ async def get_paper_recommendations_multi(
         negative_paper_ids (Optional[List[str]]): List of paper IDs to use as negative examples.
             Papers similar to these will be avoided in recommendations.
             Uses same ID formats as positive_paper_ids.
+            IDs that also appear in positive_paper_ids are ignored.
 
         fields (Optional[str]): Comma-separated list of fields to return for each paper.
             paperId is always returned.
@@ -175,16 +346,37 @@ async def get_paper_recommendations_multi(
             "recommendedPapers": List[Dict] # List of recommended papers with requested fields
         }
     """
-    try:
-        # Apply rate limiting
-        endpoint = "/recommendations"
-        await rate_limiter.acquire(endpoint)
+    return await _fetch_multi_recommendations(
+        positive_paper_ids, negative_paper_ids, fields, limit
+    )
 
-        # Validate inputs
+@async_ttl_cache(maxsize=Config.CACHE_MAX_SIZE, ttl=Config.CACHE_TTL, key=_multi_key)
+@single_flight(key=_multi_key)
+async def _fetch_multi_recommendations(
+    positive_paper_ids: List[str],
+    negative_paper_ids: Optional[List[str]],
+    fields: Optional[str],
+    limit: int
+) -> Dict:
+    """Fetch recommendations for a set of positive and negative example papers."""
+    try:
+        # Validate inputs before rate limiting so rejected requests don't use up tokens
         if not positive_paper_ids:
+            return _ERR_NO_POSITIVE_IDS
+
+        # Drop duplicate IDs (keeping order) and negatives that are also positive
+        positive_ids = list(dict.fromkeys(positive_paper_ids))
+        positive_set = set(positive_ids)
+        negative_ids = [
+            paper_id for paper_id in dict.fromkeys(negative_paper_ids or [])
+            if paper_id not in positive_set
+        ]
+
+        if len(positive_ids) > 100:
             return create_error_response(
                 ErrorType.VALIDATION,
-                "Must provide at least one positive paper ID"
+                "Cannot use more than 100 positive paper IDs",
+                {"max_papers": 100, "received": len(positive_ids)}
             )
 
         if limit > 500:
@@ -194,24 +386,29 @@ async def get_paper_recommendations_multi(
                 {"max_limit": 500, "requested": limit}
             )
 
+        # Apply rate limiting
+        endpoint = "/recommendations"
+        await rate_limiter.acquire(endpoint)
+
         # Build request parameters
         params = {"limit": limit}
         if fields:
             params["fields"] = fields
 
         request_body = {
-            "positivePaperIds": positive_paper_ids,
-            "negativePaperIds": negative_paper_ids or []
+            "positivePaperIds": positive_ids,
+            "negativePaperIds": negative_ids
         }
 
         # Make the API request
-        async with httpx.AsyncClient(timeout=Config.TIMEOUT) as client:
-            api_key = get_api_key()
-            headers = {"x-api-key": api_key} if api_key else {}
-            
-            url = "https://api.semanticscholar.org/recommendations/v1/papers"
-            response = await client.post(url, params=params, json=request_body, headers=headers)
-            
+        client = get_client()
+        async with client.stream(
+            "POST",
+            _MULTI_URL,
+            params=params,
+            content=orjson.dumps(request_body),
+            headers=_JSON_HEADERS
+        ) as response:
             # Handle specific error cases
             if response.status_code == 404:
                 return create_error_response(
@@ -222,18 +419,21 @@ async def get_paper_recommendations_multi(
                         "negative_ids": negative_paper_ids
                     }
                 )
-            
-            response.raise_for_status()
-            return response.json()
+
+            result = await _read_json(response)
+
+        rate_limiter.on_success(endpoint)
+        return result
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 429:
+            rate_limiter.on_429(endpoint, parse_retry_after(e.response.headers.get("retry-after")))
             return create_error_response(
                 ErrorType.RATE_LIMIT,
                 "Rate limit exceeded. Consider using an API key for higher limits.",
                 {
                     "retry_after": e.response.headers.get("retry-after"),
-                    "authenticated": bool(get_api_key())
+                    "authenticated": bool(_API_KEY)
                 }
             )
         return create_error_response(
@@ -247,8 +447,6 @@ async def get_paper_recommendations_multi(
             f"Request timed out after {Config.TIMEOUT} seconds"
         )
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Unexpected error in recommendations: {str(e)}")
         return create_error_response(
             ErrorType.API_ERROR,
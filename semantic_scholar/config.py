@@ -13,6 +13,12 @@ class RateLimitConfig:
     SEARCH_LIMIT = (1, 1)  # 1 request per 1 second
     BATCH_LIMIT = (1, 1)   # 1 request per 1 second
     DEFAULT_LIMIT = (10, 1)  # 10 requests per 1 second
+
+    # Adaptive backoff: the rate is multiplied by BACKOFF_FACTOR on each 429
+    # and by RECOVERY_FACTOR on each success, never dropping below MIN_RATE_FACTOR
+    BACKOFF_FACTOR = 0.5
+    RECOVERY_FACTOR = 1.05
+    MIN_RATE_FACTOR = 0.1
     
     # Endpoints categorization
     # These endpoints have stricter rate limits due to their computational intensity
@@ -157,6 +163,7 @@ class Config:
     # API Configuration
     API_VERSION = "v1"
     BASE_URL = f"https://api.semanticscholar.org/graph/{API_VERSION}"
+    RECOMMENDATIONS_BASE_URL = f"https://api.semanticscholar.org/recommendations/{API_VERSION}"
     TIMEOUT = 30  # seconds
     
     # Request Limits
@@ -164,12 +171,20 @@ class Config:
     MAX_RESULTS_PER_PAGE = 100
     DEFAULT_PAGE_SIZE = 10
     MAX_BATCHES = 5
+    MAX_CONCURRENCY = 10  # Concurrent requests per batch tool call
+    # Seeds per recommendation batch; lookups are rate limited to about one per
+    # second, so this keeps a batch call to roughly 10 seconds
+    MAX_RECOMMENDATION_BATCH_SIZE = 10
     
     # Fields Configuration
     DEFAULT_FIELDS = PaperFields.DEFAULT
     
     # Feature Flags
-    ENABLE_CACHING = False
+    ENABLE_CACHING = True
+
+    # Cache Configuration
+    CACHE_TTL = 300  # seconds
+    CACHE_MAX_SIZE = 1024  # entries per cached function
     DEBUG_MODE = False
     
     # Search Configuration
@@ -5,6 +5,7 @@ Main server module for the Semantic Scholar API Server.
 import logging
 import asyncio
 import signal
+from typing import Optional
 
 # Import mcp from centralized location
 from .mcp import mcp
@@ -18,24 +19,49 @@ logger = logging.getLogger(__name__)
 # Note: This must come AFTER mcp is initialized
 from .api import papers, authors, recommendations
 
+# Task running run_server(), and the single shared shutdown task
+_main_task: Optional[asyncio.Task] = None
+_shutdown_task: Optional[asyncio.Task] = None
+
 async def handle_exception(loop, context):
     """Global exception handler for the event loop."""
     msg = context.get("exception", context["message"])
     logger.error(f"Caught exception: {msg}")
     asyncio.create_task(shutdown())
 
-async def shutdown():
-    """Gracefully shut down the server."""
+async def shutdown(sig: Optional[signal.Signals] = None):
+    """
+    Gracefully shut down the server.
+
+    The first call starts the shutdown; later calls (repeated signals, or
+    run_server's finally block) wait for that same shutdown to finish.
+    """
+    global _shutdown_task
+    if _shutdown_task is None:
+        # If the main task isn't the caller it is still serving and must be stopped
+        cancel_main = asyncio.current_task() is not _main_task
+        _shutdown_task = asyncio.ensure_future(_shutdown(sig, cancel_main))
+    await asyncio.shield(_shutdown_task)
+
+async def _shutdown(sig: Optional[signal.Signals], cancel_main: bool):
+    """Cancel outstanding tasks and release resources."""
+    if sig is not None:
+        logger.info(f"Received {sig.name}")
     logger.info("Initiating graceful shutdown...")
-    
-    # Cancel all tasks
-    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    # The main task waits on this shutdown from its finally block,
+    # so it is cancelled but not awaited here
+    if cancel_main and _main_task is not None:
+        _main_task.cancel()
+
+    # Cancel all other tasks
+    tasks = [
+        t for t in asyncio.all_tasks()
+        if t is not asyncio.current_task() and t is not _main_task
+    ]
     for task in tasks:
         task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+    await asyncio.gather(*tasks, return_exceptions=True)
     
     # Cleanup resources
     await cleanup_client()
@@ -47,11 +73,13 @@ async def shutdown():
 def init_signal_handlers(loop):
     """Initialize signal handlers for graceful shutdown."""
     for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, lambda: asyncio.create_task(shutdown()))
+        loop.add_signal_handler(sig, lambda s=sig: asyncio.create_task(shutdown(s)))
     logger.info("Signal handlers initialized")
 
 async def run_server():
     """Run the server with proper async context management."""
+    global _main_task
+    _main_task = asyncio.current_task()
     async with mcp:
         try:
             # Initialize HTTP client
@@ -69,8 +97,13 @@ async def run_server():
 def main():
     """Main entry point for the server."""
     try:
-        # Set up event loop with exception handler
-        loop = asyncio.new_event_loop()
+        # Set up event loop with exception handler,
+        # using uvloop when it is installed (Linux/macOS only)
+        try:
+            import uvloop
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         loop.set_exception_handler(handle_exception)
         
@@ -81,6 +114,9 @@ def main():
         loop.run_until_complete(run_server())
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
+    except asyncio.CancelledError:
+        # Raised when a signal cancelled the server task; shutdown already ran
+        pass
     except Exception as e:
         logger.error(f"Fatal error: {str(e)}")
     finally:
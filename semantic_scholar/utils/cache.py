@@ -0,0 +1,110 @@
+"""
+Response caching utilities for the Semantic Scholar API Server.
+"""
+
+import asyncio
+import copy
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..config import Config
+
+def _default_key(*args, **kwargs) -> Hashable:
+    """Build a cache key from the positional and keyword arguments of a call."""
+    return args, tuple(sorted(kwargs.items()))
+
+def async_ttl_cache(
+    maxsize: int = 1024,
+    ttl: float = 300,
+    key: Optional[Callable[..., Hashable]] = None
+):
+    """
+    Cache the results of an async function in memory with LRU eviction and a TTL.
+
+    Error responses (dicts containing an "error" key) are never cached. Caching
+    is bypassed entirely when Config.ENABLE_CACHING is False. Results are deep
+    copied into and out of the cache, so callers may mutate what they receive.
+
+    Args:
+        maxsize: Maximum number of entries to keep before evicting the least recently used.
+        ttl: Number of seconds an entry stays valid.
+        key: Optional function building the cache key from the call arguments.
+            Defaults to the positional and keyword arguments themselves.
+
+    Returns:
+        A decorator for async functions. The wrapped function exposes cache_clear().
+    """
+    make_key = key or _default_key
+
+    def decorator(func: Callable) -> Callable:
+        cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not Config.ENABLE_CACHING:
+                return await func(*args, **kwargs)
+
+            cache_key = make_key(*args, **kwargs)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    cache.move_to_end(cache_key)
+                    return copy.deepcopy(value)
+                del cache[cache_key]
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, dict) and "error" in result:
+                return result
+
+            cache[cache_key] = (time.monotonic() + ttl, copy.deepcopy(result))
+            cache.move_to_end(cache_key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+def single_flight(key: Optional[Callable[..., Hashable]] = None):
+    """
+    Coalesce concurrent identical calls to an async function into one execution.
+
+    While a call is in flight, later callers with the same key await its result
+    instead of starting their own. A caller being cancelled does not cancel the
+    shared call for the others.
+
+    Args:
+        key: Optional function building the deduplication key from the call arguments.
+            Defaults to the positional and keyword arguments themselves.
+
+    Returns:
+        A decorator for async functions.
+    """
+    make_key = key or _default_key
+
+    def decorator(func: Callable) -> Callable:
+        inflight: Dict[Hashable, asyncio.Future] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            flight_key = make_key(*args, **kwargs)
+            task = inflight.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                inflight[flight_key] = task
+
+                def release(done: asyncio.Future) -> None:
+                    if inflight.get(flight_key) is done:
+                        del inflight[flight_key]
+
+                task.add_done_callback(release)
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
@@ -19,11 +19,19 @@ http_client = None
 
 class RateLimiter:
     """
-    Rate limiter for API requests to prevent exceeding API limits.
+    Token-bucket rate limiter for API requests to prevent exceeding API limits.
+
+    Each endpoint's bucket holds at most one token and refills one token every
+    rate_limit[1] seconds, i.e. at most one request per interval. No lock is
+    needed: the event loop is single-threaded and nothing awaits between reading
+    and updating the bucket, so the fast path never awaits.
+
+    The refill rate adapts to the API's feedback: it is cut on every 429 response
+    (see on_429) and grows back gradually as requests succeed (see on_success).
     """
     def __init__(self):
-        self._last_call_time = {}
-        self._locks = {}
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._rate_factors: Dict[str, float] = {}
 
     def _get_rate_limit(self, endpoint: str) -> Tuple[int, int]:
         """Get the appropriate rate limit for an endpoint."""
@@ -42,24 +50,76 @@ class RateLimiter:
         Args:
             endpoint: The API endpoint being accessed.
         """
-        if endpoint not in self._locks:
-            self._locks[endpoint] = asyncio.Lock()
-            self._last_call_time[endpoint] = 0
-
-        async with self._locks[endpoint]:
-            rate_limit = self._get_rate_limit(endpoint)
-            current_time = time.time()
-            time_since_last_call = current_time - self._last_call_time[endpoint]
-            
-            if time_since_last_call < rate_limit[1]:
-                delay = rate_limit[1] - time_since_last_call
-                await asyncio.sleep(delay)
-            
-            self._last_call_time[endpoint] = time.time()
+        # Only the interval is enforced, one request per `seconds`
+        _, seconds = self._get_rate_limit(endpoint)
+
+        while True:
+            # Re-read each pass so waiters pick up a backoff from on_429
+            rate = self._rate_factors.get(endpoint, 1.0) / seconds
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(endpoint, (1.0, now))
+            tokens = min(1.0, tokens + rate * (now - last_refill))
+
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / rate)
+                continue
+
+            self._buckets[endpoint] = (tokens - 1, now)
+            return
+
+    def on_429(self, endpoint: str, retry_after: float):
+        """
+        Back off after the API rejected a request with 429 Too Many Requests.
+
+        Cuts the endpoint's rate and empties its bucket so no further requests
+        are let through until retry_after seconds have passed.
+
+        Args:
+            endpoint: The API endpoint that was rate limited.
+            retry_after: Seconds the API asked us to wait before retrying.
+        """
+        factor = self._rate_factors.get(endpoint, 1.0)
+        self._rate_factors[endpoint] = max(
+            RateLimitConfig.MIN_RATE_FACTOR,
+            factor * RateLimitConfig.BACKOFF_FACTOR
+        )
+        self._buckets[endpoint] = (0.0, time.monotonic() + max(0.0, retry_after))
+        logger.warning(
+            f"Rate limited on {endpoint}, reducing request rate to "
+            f"{self._rate_factors[endpoint]:.0%} for at least {retry_after}s"
+        )
+
+    def on_success(self, endpoint: str):
+        """
+        Gradually restore an endpoint's rate after a successful request.
+
+        Args:
+            endpoint: The API endpoint that answered successfully.
+        """
+        factor = self._rate_factors.get(endpoint)
+        if factor is None:
+            return
+        factor *= RateLimitConfig.RECOVERY_FACTOR
+        if factor >= 1.0:
+            del self._rate_factors[endpoint]
+        else:
+            self._rate_factors[endpoint] = factor
 
 # Create global rate limiter instance
 rate_limiter = RateLimiter()
 
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """
+    Parse a retry-after header given in seconds.
+
+    Returns the default if the header is missing or not a number of seconds
+    (e.g. an HTTP date).
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
 def get_api_key() -> Optional[str]:
     """
     Get the Semantic Scholar API key from environment variables.
@@ -70,16 +130,30 @@ def get_api_key() -> Optional[str]:
         logger.warning("No SEMANTIC_SCHOLAR_API_KEY set. Using unauthenticated access with lower rate limits.")
     return api_key
 
-async def initialize_client():
-    """Initialize the global HTTP client."""
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Reusing a single client keeps connections alive between requests
+    instead of paying a new TCP/TLS handshake for every call. HTTP/2 lets
+    concurrent requests to the same host share one connection.
+    """
     global http_client
     if http_client is None:
         http_client = httpx.AsyncClient(
+            http2=True,
             timeout=Config.TIMEOUT,
-            limits=httpx.Limits(max_keepalive_connections=10)
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=200
+            )
         )
     return http_client
 
+async def initialize_client():
+    """Initialize the global HTTP client."""
+    return get_client()
+
 async def cleanup_client():
     """Clean up the global HTTP client."""
     global http_client
@@ -108,13 +182,15 @@ async def make_request(endpoint: str, params: Dict = None) -> Dict:
         url = f"{Config.BASE_URL}{endpoint}"
 
         # Use global client
-        client = await initialize_client()
+        client = get_client()
         response = await client.get(url, params=params, headers=headers)
         response.raise_for_status()
+        rate_limiter.on_success(endpoint)
         return response.json()
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error {e.response.status_code} for {endpoint}: {e.response.text}")
         if e.response.status_code == 429:
+            rate_limiter.on_429(endpoint, parse_retry_after(e.response.headers.get("retry-after")))
             return create_error_response(
                 ErrorType.RATE_LIMIT,
                 "Rate limit exceeded. Consider using an API key for higher limits.",
@@ -0,0 +1,172 @@
+import unittest
+import asyncio
+from unittest import mock
+
+from semantic_scholar.config import Config
+from semantic_scholar.utils.cache import async_ttl_cache, single_flight
+
+class TestAsyncTTLCache(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment"""
+        # Create event loop for async tests
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.calls = []
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.loop.close()
+
+    def run_async(self, coro):
+        """Helper to run async functions in tests"""
+        return self.loop.run_until_complete(coro)
+
+    def make_cached(self, maxsize=2, ttl=60):
+        """Build a cached function that records every underlying call"""
+        @async_ttl_cache(maxsize=maxsize, ttl=ttl)
+        async def fetch(value):
+            self.calls.append(value)
+            if value < 0:
+                return {"error": {"type": "validation", "message": "negative", "details": {}}}
+            return {"value": value}
+        return fetch
+
+    def test_repeated_call_is_cached(self):
+        """Test that a repeated call returns the cached result"""
+        fetch = self.make_cached()
+        first = self.run_async(fetch(1))
+        second = self.run_async(fetch(1))
+        self.assertEqual(first, {"value": 1})
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, [1])
+
+    def test_mutating_result_does_not_corrupt_cache(self):
+        """Test that callers mutating a result don't change what later callers get"""
+        fetch = self.make_cached()
+        first = self.run_async(fetch(1))
+        first["value"] = "changed"
+        second = self.run_async(fetch(1))
+        second["extra"] = True
+        self.assertEqual(self.run_async(fetch(1)), {"value": 1})
+        self.assertEqual(self.calls, [1])
+
+    def test_ttl_expiry(self):
+        """Test that entries are refetched once their TTL has elapsed"""
+        fetch = self.make_cached(ttl=0.05)
+        self.run_async(fetch(1))
+        self.run_async(asyncio.sleep(0.1))
+        self.run_async(fetch(1))
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full"""
+        fetch = self.make_cached(maxsize=2)
+        self.run_async(fetch(1))
+        self.run_async(fetch(2))
+        self.run_async(fetch(1))  # 1 is now most recently used
+        self.run_async(fetch(3))  # evicts 2
+        self.run_async(fetch(1))
+        self.run_async(fetch(2))
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+
+    def test_error_responses_not_cached(self):
+        """Test that error responses are never cached"""
+        fetch = self.make_cached()
+        self.run_async(fetch(-1))
+        result = self.run_async(fetch(-1))
+        self.assertIn("error", result)
+        self.assertEqual(self.calls, [-1, -1])
+
+    def test_disabled_caching_bypasses_cache(self):
+        """Test that Config.ENABLE_CACHING=False skips the cache entirely"""
+        fetch = self.make_cached()
+        with mock.patch.object(Config, "ENABLE_CACHING", False):
+            self.run_async(fetch(1))
+            self.run_async(fetch(1))
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_cache_clear(self):
+        """Test that cache_clear drops all entries"""
+        fetch = self.make_cached()
+        self.run_async(fetch(1))
+        fetch.cache_clear()
+        self.run_async(fetch(1))
+        self.assertEqual(self.calls, [1, 1])
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment"""
+        # Create event loop for async tests
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.calls = []
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.loop.close()
+
+    def run_async(self, coro):
+        """Helper to run async functions in tests"""
+        return self.loop.run_until_complete(coro)
+
+    def make_coalesced(self, delay=0.05):
+        """Build a coalesced function that records every underlying call"""
+        @single_flight()
+        async def fetch(value):
+            self.calls.append(value)
+            await asyncio.sleep(delay)
+            return {"value": value}
+        return fetch
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that N concurrent identical calls run the function once"""
+        fetch = self.make_coalesced()
+
+        async def run():
+            return await asyncio.gather(*[fetch(1) for _ in range(5)], fetch(2))
+
+        results = self.run_async(run())
+        self.assertEqual(results, [{"value": 1}] * 5 + [{"value": 2}])
+        self.assertEqual(sorted(self.calls), [1, 2])
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that a call after the previous one finished runs again"""
+        fetch = self.make_coalesced(delay=0)
+        self.run_async(fetch(1))
+        self.run_async(fetch(1))
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that cancelling one waiting caller leaves the shared call running"""
+        fetch = self.make_coalesced()
+
+        async def run():
+            first = asyncio.ensure_future(fetch(1))
+            second = asyncio.ensure_future(fetch(1))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            result = await second
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            return result
+
+        self.assertEqual(self.run_async(run()), {"value": 1})
+        self.assertEqual(self.calls, [1])
+
+    def test_exceptions_propagate_to_all_callers(self):
+        """Test that an exception from the shared call reaches every caller"""
+        @single_flight()
+        async def fail():
+            self.calls.append(None)
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(fail(), fail(), return_exceptions=True)
+
+        results = self.run_async(run())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(len(self.calls), 1)
+
+if __name__ == '__main__':
+    unittest.main()
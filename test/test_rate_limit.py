@@ -0,0 +1,156 @@
+import unittest
+import asyncio
+import time
+from unittest import mock
+
+import httpx
+
+from semantic_scholar.config import RateLimitConfig
+from semantic_scholar.utils.http import RateLimiter, parse_retry_after
+from semantic_scholar.api import recommendations
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment"""
+        # Create event loop for async tests
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        # Short interval so tests don't wait on the real limits
+        patcher = mock.patch.object(RateLimitConfig, "DEFAULT_LIMIT", (1, 0.1))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.limiter = RateLimiter()
+        self.endpoint = "/recommendations"
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.loop.close()
+
+    def run_async(self, coro):
+        """Helper to run async functions in tests"""
+        return self.loop.run_until_complete(coro)
+
+    def timed_acquire(self) -> float:
+        """Acquire once and return how long it took"""
+        start = time.monotonic()
+        self.run_async(self.limiter.acquire(self.endpoint))
+        return time.monotonic() - start
+
+    def test_one_request_per_interval(self):
+        """Test that requests are spaced by the configured interval"""
+        self.assertLess(self.timed_acquire(), 0.05)
+        self.assertGreaterEqual(self.timed_acquire(), 0.08)
+
+    def test_backoff_floor(self):
+        """Test that repeated 429s never cut the rate below MIN_RATE_FACTOR"""
+        for _ in range(20):
+            self.limiter.on_429(self.endpoint, 0)
+        self.assertEqual(
+            self.limiter._rate_factors[self.endpoint],
+            RateLimitConfig.MIN_RATE_FACTOR
+        )
+
+    def test_recovery_after_success(self):
+        """Test that successes grow the rate back to, and not past, the limit"""
+        self.limiter.on_429(self.endpoint, 0)
+        self.assertEqual(self.limiter._rate_factors[self.endpoint], RateLimitConfig.BACKOFF_FACTOR)
+
+        self.limiter.on_success(self.endpoint)
+        self.assertAlmostEqual(
+            self.limiter._rate_factors[self.endpoint],
+            RateLimitConfig.BACKOFF_FACTOR * RateLimitConfig.RECOVERY_FACTOR
+        )
+
+        for _ in range(50):
+            self.limiter.on_success(self.endpoint)
+        self.assertNotIn(self.endpoint, self.limiter._rate_factors)
+
+    def test_retry_after_blocks_bucket(self):
+        """Test that no request is let through until retry-after has passed"""
+        self.timed_acquire()
+        self.limiter.on_429(self.endpoint, 0.2)
+        # retry-after, plus one interval at the halved rate
+        self.assertGreaterEqual(self.timed_acquire(), 0.35)
+
+    def test_waiting_caller_picks_up_backoff(self):
+        """Test that a caller already waiting when a 429 arrives is slowed down too"""
+        async def run():
+            await self.limiter.acquire(self.endpoint)
+            start = time.monotonic()
+            waiter = asyncio.ensure_future(self.limiter.acquire(self.endpoint))
+            await asyncio.sleep(0.02)
+            self.limiter.on_429(self.endpoint, 0)
+            await waiter
+            return time.monotonic() - start
+
+        # One interval at the halved rate after the 429, not the original interval
+        self.assertGreaterEqual(self.run_async(run()), 0.2)
+
+    def test_parse_retry_after(self):
+        """Test parsing of retry-after header values"""
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertEqual(parse_retry_after(None), 1.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 1.0)
+
+class TestRecommendationRateFeedback(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment"""
+        # Create event loop for async tests
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.limiter = RateLimiter()
+        self.responses = []
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+        for patcher in (
+            mock.patch.object(RateLimitConfig, "DEFAULT_LIMIT", (1, 0.01)),
+            mock.patch.object(recommendations, "rate_limiter", self.limiter),
+            mock.patch.object(recommendations, "get_client", lambda: self.client),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        recommendations._fetch_single_recommendations.cache_clear()
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+
+    def run_async(self, coro):
+        """Helper to run async functions in tests"""
+        return self.loop.run_until_complete(coro)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Serve the next queued mock response"""
+        return self.responses.pop(0)
+
+    def fetch(self, paper_id: str):
+        """Fetch single-paper recommendations through the mocked client"""
+        return self.run_async(
+            recommendations._fetch_single_recommendations(paper_id, None, 10, "recent")
+        )
+
+    def test_429_then_success(self):
+        """Test that a 429 backs off the limiter and a success starts recovery"""
+        self.responses = [
+            httpx.Response(429, headers={"retry-after": "0"}, text="slow down"),
+            httpx.Response(200, json={"recommendedPapers": []}),
+        ]
+
+        result = self.fetch("paper-a")
+        self.assertEqual(result["error"]["type"], "rate_limit")
+        self.assertEqual(result["error"]["details"]["retry_after"], "0")
+        self.assertEqual(self.limiter._rate_factors["/recommendations"], RateLimitConfig.BACKOFF_FACTOR)
+
+        result = self.fetch("paper-b")
+        self.assertEqual(result, {"recommendedPapers": []})
+        self.assertAlmostEqual(
+            self.limiter._rate_factors["/recommendations"],
+            RateLimitConfig.BACKOFF_FACTOR * RateLimitConfig.RECOVERY_FACTOR
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+import asyncio
+import json
+from unittest import mock
+
+import httpx
+
+from semantic_scholar.config import Config, RateLimitConfig
+from semantic_scholar.utils.http import RateLimiter
+from semantic_scholar.api import recommendations
+
+class MockedRecommendationTestCase(unittest.TestCase):
+    """Base class running the recommendation helpers against a mocked client"""
+
+    def setUp(self):
+        """Set up test environment"""
+        # Create event loop for async tests
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.requests = []
+        self.responses = []
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+        for patcher in (
+            mock.patch.object(RateLimitConfig, "DEFAULT_LIMIT", (1, 0.01)),
+            mock.patch.object(recommendations, "rate_limiter", RateLimiter()),
+            mock.patch.object(recommendations, "get_client", lambda: self.client),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        recommendations._fetch_single_recommendations.cache_clear()
+        recommendations._fetch_multi_recommendations.cache_clear()
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+
+    def run_async(self, coro):
+        """Helper to run async functions in tests"""
+        return self.loop.run_until_complete(coro)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Record the request and serve the next queued mock response"""
+        self.requests.append(request)
+        return self.responses.pop(0)
+
+class TestSingleRecommendationResponses(MockedRecommendationTestCase):
+    def fetch(self, paper_id: str):
+        """Fetch single-paper recommendations through the mocked client"""
+        return self.run_async(
+            recommendations._fetch_single_recommendations(paper_id, None, 10, "recent")
+        )
+
+    def test_redirect_reported_as_http_error(self):
+        """Test that a non-2xx, non-error status is reported as an HTTP error"""
+        self.responses = [
+            httpx.Response(302, headers={"location": "https://example.org"}, text="moved")
+        ]
+        result = self.fetch("a")
+        self.assertEqual(result["error"]["type"], "api_error")
+        self.assertEqual(result["error"]["message"], "HTTP error 302")
+        self.assertEqual(result["error"]["details"]["response"], "moved")
+
+class TestRecommendationBatch(MockedRecommendationTestCase):
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Return recommendations for known papers and 404 for "missing" """
+        self.requests.append(request)
+        paper_id = request.url.path.rsplit("/", 1)[-1]
+        if paper_id == "missing":
+            return httpx.Response(404, text="not found")
+        return httpx.Response(200, json={"recommendedPapers": [{"paperId": f"rec-{paper_id}"}]})
+
+    def batch(self, paper_ids, **kwargs):
+        """Call the batch tool through the mocked client"""
+        return self.run_async(
+            recommendations.get_paper_recommendations_batch(None, paper_ids, **kwargs)
+        )
+
+    def test_empty_list(self):
+        """Test that an empty list is rejected without any request"""
+        result = self.batch([])
+        self.assertEqual(result["error"]["type"], "validation")
+        self.assertEqual(self.requests, [])
+
+    def test_oversized_list(self):
+        """Test that more than the allowed number of IDs is rejected"""
+        paper_ids = [f"p{i}" for i in range(Config.MAX_RECOMMENDATION_BATCH_SIZE + 1)]
+        result = self.batch(paper_ids)
+        self.assertEqual(result["error"]["type"], "validation")
+        self.assertEqual(
+            result["error"]["details"]["received"],
+            Config.MAX_RECOMMENDATION_BATCH_SIZE + 1
+        )
+        self.assertEqual(self.requests, [])
+
+    def test_bad_limit_returns_one_error(self):
+        """Test that an invalid limit yields a single error, not one per paper"""
+        result = self.batch(["a", "b"], limit=501)
+        self.assertEqual(set(result), {"error"})
+        self.assertEqual(result["error"]["details"]["requested"], 501)
+        self.assertEqual(self.requests, [])
+
+    def test_bad_pool_returns_one_error(self):
+        """Test that an invalid pool yields a single error, not one per paper"""
+        result = self.batch(["a", "b"], from_pool="everything")
+        self.assertEqual(set(result), {"error"})
+        self.assertEqual(result["error"]["message"], "Invalid paper pool specified")
+        self.assertEqual(self.requests, [])
+
+    def test_results_mapped_per_id(self):
+        """Test that each seed maps to its own result or error"""
+        result = self.batch(["a", "missing", "b"])
+        self.assertEqual(list(result), ["a", "missing", "b"])
+        self.assertEqual(result["a"], {"recommendedPapers": [{"paperId": "rec-a"}]})
+        self.assertEqual(result["b"], {"recommendedPapers": [{"paperId": "rec-b"}]})
+        self.assertEqual(result["missing"]["error"]["message"], "Paper not found")
+
+class TestMultiRecommendations(MockedRecommendationTestCase):
+    def fetch(self, positive_paper_ids, negative_paper_ids=None, limit=10):
+        """Fetch multi-paper recommendations through the mocked client"""
+        return self.run_async(
+            recommendations._fetch_multi_recommendations(
+                positive_paper_ids, negative_paper_ids, None, limit
+            )
+        )
+
+    def test_equivalent_requests_share_cache_entry(self):
+        """Test that requests normalising to the same body hit the same cache entry"""
+        self.responses = [httpx.Response(200, json={"recommendedPapers": []})]
+        self.fetch(["a", "a"], ["a", "n"])
+        result = self.fetch(["a"], ["n", "n"])
+        self.assertEqual(result, {"recommendedPapers": []})
+        self.assertEqual(len(self.requests), 1)
+
+    def test_ids_deduped_before_sending(self):
+        """Test that duplicates and positive/negative overlap are dropped in order"""
+        self.responses = [httpx.Response(200, json={"recommendedPapers": []})]
+        self.fetch(["p", "p", "q"], ["q", "n", "n"])
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(
+            json.loads(self.requests[0].content),
+            {"positivePaperIds": ["p", "q"], "negativePaperIds": ["n"]}
+        )
+
+    def test_too_many_positive_ids(self):
+        """Test that more than 100 unique positive IDs is rejected locally"""
+        result = self.fetch([f"p{i}" for i in range(101)])
+        self.assertEqual(result["error"]["type"], "validation")
+        self.assertEqual(result["error"]["details"], {"max_papers": 100, "received": 101})
+        self.assertEqual(self.requests, [])
+
+    def test_duplicates_do_not_count_towards_limit(self):
+        """Test that the 100-ID limit applies to unique IDs only"""
+        self.responses = [httpx.Response(200, json={"recommendedPapers": []})]
+        result = self.fetch([f"p{i}" for i in range(100)] * 2)
+        self.assertEqual(result, {"recommendedPapers": []})
+        self.assertEqual(len(json.loads(self.requests[0].content)["positivePaperIds"]), 100)
+
+if __name__ == '__main__':
+    unittest.main()